@@ -2,11 +2,21 @@
 
 import logging
 import os
-import traceback
+import shutil
 import uuid
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeouts so a hung socket cannot pin a worker indefinitely;
+# media transfers are allowed a longer read window
+REQUEST_TIMEOUT = (3.05, 27)
+MEDIA_TIMEOUT = (3.05, 120)
+
+# 1 MiB per chunk keeps downloads network-bound instead of interpreter-bound
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 class UltramsgAPI:
@@ -14,6 +24,24 @@ class UltramsgAPI:
 
     logger = logging.getLogger(__name__)
 
+    # shared session so repeated Ultramsg calls reuse pooled keep-alive
+    # connections instead of paying a TLS handshake per request; transient
+    # 429/5xx responses are retried in-adapter with exponential backoff
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "POST"]),
+            ),
+        ),
+    )
+
     @staticmethod
     def parse_inbound_message(request: dict) -> dict:
         """Parses message request payload and returns extracted values"""
@@ -47,20 +75,23 @@ class UltramsgAPI:
 
         if request:
 
-            data["message_id"] = request["data"]["id"]
+            # bind the nested payload once rather than re-indexing it per field
+            payload = request["data"]
+
+            data["message_id"] = payload["id"]
             data["instance_id"] = request["instanceId"]
             data["event_type"] = request["event_type"]
-            data["time"] = request["data"]["time"]
-            data["author"] = request["data"]["author"]
-            data["from_self"] = request["data"]["fromMe"]
-            data["sender_name"] = request.get("data", {}).get("pushname", "")
-            data["sender_number"] = str(request["data"]["from"].replace("@c.us", ""))
-            data["agent_number"] = str(request["data"]["to"].replace("@c.us", ""))
-            data["parent_message"] = request["data"].get("quotedMsg", "")
-            data["message_type"] = request["data"].get("type", "unknown")
-            data["body"] = request["data"]["body"]
-            data["media"] = request.get("data", {}).get("media", "")
-            data["location"] = request.get("data", {}).get("location", "")
+            data["time"] = payload["time"]
+            data["author"] = payload["author"]
+            data["from_self"] = payload["fromMe"]
+            data["sender_name"] = payload.get("pushname", "")
+            data["sender_number"] = payload["from"].replace("@c.us", "")
+            data["agent_number"] = payload["to"].replace("@c.us", "")
+            data["parent_message"] = payload.get("quotedMsg", "")
+            data["message_type"] = payload.get("type", "unknown")
+            data["body"] = payload["body"]
+            data["media"] = payload.get("media", "")
+            data["location"] = payload.get("location", "")
             # add caption to media messages if present
             if data["message_type"] != "chat":
                 data["caption"] = data["body"]
@@ -94,8 +125,13 @@ class UltramsgAPI:
 
         try:
             # Support for GET, POST, PUT, DELETE, etc.
-            response = requests.request(
-                method=method, url=url, headers=headers, json=data, params=params
+            response = UltramsgAPI.session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=data,
+                params=params,
+                timeout=REQUEST_TIMEOUT,
             )
 
             # Check if the response is successful
@@ -104,12 +140,14 @@ class UltramsgAPI:
 
                 if result and result.get("error", False):
                     UltramsgAPI.logger.error(
-                        f"Ultramsg request error: {result.get('error', False)}"
+                        "Ultramsg request error: %s", result.get("error", False)
                     )
 
                 return result
             else:
-                error = f"Request failed with status code {response.status_code}, response: {response.text}"
+                # cap the reported body so a large upstream error page cannot
+                # flood the log or the returned error dict
+                error = f"Request failed with status code {response.status_code}, response: {response.text[:1024]}"
                 UltramsgAPI.logger.error(error)
                 return {"error": error}
 
@@ -619,16 +657,21 @@ class UltramsgAPI:
             dict: A dictionary with the status code of the operation.
         """
         try:
-            response = requests.get(media_url)
+            response = UltramsgAPI.session.get(
+                media_url, stream=True, timeout=MEDIA_TIMEOUT
+            )
             response.raise_for_status()  # Raise an exception if the response status is not 200 OK
 
             # Get the content type from the response headers
             mime_type = response.headers.get("Content-Type", "")
 
             if filename:
-                # utiilse the filename if provided
+                # utiilse the filename if provided; stream to disk so large
+                # media never has to be held fully in memory. decode_content
+                # keeps gzip/deflate transparent while copying the raw stream.
+                response.raw.decode_content = True
                 with open(filename, "wb") as file:
-                    file.write(response.content)
+                    shutil.copyfileobj(response.raw, file, length=DOWNLOAD_CHUNK_SIZE)
 
                 if os.path.exists(filename):
                     message = f"media saved to {filename} successfully"
@@ -647,7 +690,7 @@ class UltramsgAPI:
                 }
 
         except requests.exceptions.RequestException as e:
-            UltramsgAPI.logger.error(f"an exception occurred, {traceback.format_exc()}")
+            UltramsgAPI.logger.exception("an exception occurred")
             return {"error": str(e)}
 
     @staticmethod
@@ -696,8 +739,13 @@ class UltramsgAPI:
             if os.path.exists(filename):
                 os.remove(filename)
 
-            response = requests.request(
-                "POST", api_url, headers=headers, data=data, files=files
+            response = UltramsgAPI.session.request(
+                "POST",
+                api_url,
+                headers=headers,
+                data=data,
+                files=files,
+                timeout=MEDIA_TIMEOUT,
             )
 
             # Check if request was successful
@@ -710,7 +758,7 @@ class UltramsgAPI:
                 }
                 status = "error"
         except Exception as e:
-            UltramsgAPI.logger.error(f"an exception occurred, {traceback.format_exc()}")
+            UltramsgAPI.logger.exception("an exception occurred")
             result = {"message": f"Error: {str(e)}"}
             status = "error"
 